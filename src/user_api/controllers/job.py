@@ -0,0 +1,35 @@
+from litestar import Controller, get
+from litestar.datastructures import State
+from litestar.exceptions import HTTPException
+from litestar.params import Parameter
+from uuid import UUID
+from src.user_api.schemas.job import JobDTO
+
+class JobController(Controller):
+    path = "/jobs"
+
+    @get(
+        "/{job_id:uuid}",
+        description="Retrieve the status and progress of a background job."
+    )
+    async def get_job(
+            self,
+            state: State,
+            job_id: UUID = Parameter(title="Job ID", description="The job to retrieve."),
+    ) -> JobDTO:
+        """Get a job by ID.
+
+        Args:
+            state: The application state holding the bulk job manager.
+            job_id: The UUID of the job to retrieve.
+
+        Returns:
+            The job status in DTO format.
+
+        Raises:
+            HTTPException: If the job is not found (404).
+        """
+        job = state.bulk_jobs.get(job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return JobDTO.model_validate(job)
@@ -1,5 +1,7 @@
 from litestar import Controller, get, post, put, delete
+from litestar.datastructures import State
 from litestar.exceptions import HTTPException
+from litestar.status_codes import HTTP_202_ACCEPTED
 from litestar.params import Parameter, Body
 from uuid import UUID
 from advanced_alchemy.extensions.litestar import (
@@ -9,7 +11,9 @@ from advanced_alchemy.extensions.litestar import (
     service,
 )
 from src.user_api.models.user import User
-from src.user_api.schemas.user import UserDTO, UserCreateDTO, UserUpdateDTO
+from src.user_api.schemas.job import JobDTO
+from src.user_api.schemas.user import UserDTO, UserCreateDTO, UserUpdateDTO, UserBulkFilterDTO, UserBulkUpdateDTO
+from src.user_api.services.user_filters import build_search_filters
 
 class UserService(service.SQLAlchemyAsyncRepositoryService[User]):
     """User repository service."""
@@ -54,11 +58,7 @@ class UserController(Controller):
         Raises:
             HTTPException: If an error occurs during database query.
         """
-        filter_conditions = []
-        if name:
-            filter_conditions.append(filters.SearchFilter(field_name="name", value=name, ignore_case=True))
-        if surname:
-            filter_conditions.append(filters.SearchFilter(field_name="surname", value=surname, ignore_case=True))
+        filter_conditions = build_search_filters(name, surname)
         filter_conditions.append(filters.LimitOffset(limit=limit, offset=offset))
 
         results, _ = await users_service.list_and_count(*filter_conditions)
@@ -171,4 +171,61 @@ class UserController(Controller):
         user = await users_service.get(user_id)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
-        await users_service.delete(user_id)
\ No newline at end of file
+        await users_service.delete(user_id)
+
+    @post(
+        "/bulk-delete",
+        status_code=HTTP_202_ACCEPTED,
+        description="Start a background job deleting all users matching the name/surname filters.",
+    )
+    async def bulk_delete_users(self, state: State, data: UserBulkFilterDTO) -> JobDTO:
+        """Start a bulk delete job.
+
+        Args:
+            state: The application state holding the bulk job manager.
+            data: The name/surname filters and chunking options.
+
+        Returns:
+            The created job; poll `/jobs/{job_id}` for progress.
+
+        Raises:
+            HTTPException: If no filter is provided (400).
+        """
+        search_filters = build_search_filters(data.name, data.surname, literal=True)
+        if not search_filters:
+            raise HTTPException(status_code=400, detail="At least one filter must be provided")
+
+        job = state.bulk_jobs.start_delete(search_filters, data.chunk_size, data.throttle_ms)
+        return JobDTO.model_validate(job)
+
+    @post(
+        "/bulk-update",
+        status_code=HTTP_202_ACCEPTED,
+        description="Start a background job updating all users matching the name/surname filters.",
+    )
+    async def bulk_update_users(self, state: State, data: UserBulkUpdateDTO) -> JobDTO:
+        """Start a bulk update job.
+
+        Args:
+            state: The application state holding the bulk job manager.
+            data: The name/surname filters, chunking options and fields to set.
+
+        Returns:
+            The created job; poll `/jobs/{job_id}` for progress.
+
+        Raises:
+            HTTPException: If no filter (400) or no fields for update (400) are provided,
+                or a field is set to null (400).
+        """
+        search_filters = build_search_filters(data.name, data.surname, literal=True)
+        if not search_filters:
+            raise HTTPException(status_code=400, detail="At least one filter must be provided")
+
+        update_data = data.data.model_dump(exclude_unset=True)
+        if not update_data:
+            raise HTTPException(status_code=400, detail="No fields provided for update")
+        if None in update_data.values():
+            raise HTTPException(status_code=400, detail="Fields cannot be set to null")
+
+        job = state.bulk_jobs.start_update(search_filters, update_data, data.chunk_size, data.throttle_ms)
+        return JobDTO.model_validate(job)
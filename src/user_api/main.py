@@ -1,6 +1,9 @@
 from litestar import Litestar
+from litestar.datastructures import State
+from src.user_api.controllers.job import JobController
 from src.user_api.controllers.user import UserController
 from src.user_api.config.settings import get_openapi_config, get_db_config
+from src.user_api.services.bulk_jobs import BulkJobManager
 from litestar.plugins.sqlalchemy import SQLAlchemyPlugin
 from advanced_alchemy.extensions.litestar import SQLAlchemyAsyncConfig
 from typing import Optional
@@ -8,10 +11,13 @@ from typing import Optional
 def create_app(db_config: Optional[SQLAlchemyAsyncConfig] = None) -> Litestar:
     if db_config is None:
         db_config = get_db_config()
+    bulk_jobs = BulkJobManager(db_config)
     return Litestar(
-        route_handlers=[UserController],
+        route_handlers=[UserController, JobController],
         plugins=[SQLAlchemyPlugin(config=db_config)],
         openapi_config=get_openapi_config(),
+        state=State({"bulk_jobs": bulk_jobs}),
+        on_shutdown=[bulk_jobs.shutdown],
     )
 
 app = create_app()
\ No newline at end of file
@@ -0,0 +1,27 @@
+from datetime import datetime
+from enum import StrEnum
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class JobStatus(StrEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+class JobDTO(BaseModel):
+    id: UUID
+    operation: str
+    status: JobStatus
+    total: int | None
+    processed: int
+    error: str | None
+    created_at: datetime
+    finished_at: datetime | None
+
+    model_config = ConfigDict(
+        from_attributes=True,
+    )
@@ -43,4 +43,13 @@ class UserCreateDTO(BaseModel):
 
         if errors:
             raise ValueError(f"Пароль должен содержать: {', '.join(errors)}")
-        return v
\ No newline at end of file
+        return v
+
+class UserBulkFilterDTO(BaseModel):
+    name: str | None = Field(default=None, description="Match users by name (case-insensitive)")
+    surname: str | None = Field(default=None, description="Match users by surname (case-insensitive)")
+    chunk_size: int = Field(default=500, ge=1, le=1000, description="Number of users processed per transaction")
+    throttle_ms: int = Field(default=0, ge=0, le=60000, description="Pause between chunks in milliseconds")
+
+class UserBulkUpdateDTO(UserBulkFilterDTO):
+    data: UserUpdateDTO = Field(..., description="Fields to set on every matched user")
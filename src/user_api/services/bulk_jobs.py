@@ -0,0 +1,157 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID, uuid4
+
+from advanced_alchemy.extensions.litestar import SQLAlchemyAsyncConfig, filters
+from sqlalchemy import Delete, Select, Update, delete, func, select, update
+
+from src.user_api.models.user import User
+from src.user_api.schemas.job import JobStatus
+
+logger = logging.getLogger(__name__)
+
+
+def _apply_filters(statement: Select, search_filters: list[filters.SearchFilter]) -> Select:
+    for search_filter in search_filters:
+        statement = search_filter.append_to_statement(statement, User)
+    return statement
+
+
+@dataclass
+class BulkJob:
+    """State of a single bulk operation, exposed through the job-status endpoint."""
+    operation: str
+    id: UUID = field(default_factory=uuid4)
+    status: JobStatus = JobStatus.PENDING
+    total: int | None = None
+    processed: int = 0
+    error: str | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: datetime | None = None
+
+
+class BulkJobManager:
+    """Run filter-based bulk operations on users as background tasks.
+
+    Matching users are walked in primary-key order and each chunk is handled in its own
+    short transaction, so no long lock is held. Jobs are kept in memory of the current
+    process; only the most recent ``max_jobs`` are retained.
+    """
+
+    def __init__(self, db_config: SQLAlchemyAsyncConfig, max_jobs: int = 100) -> None:
+        self._db_config = db_config
+        self._max_jobs = max_jobs
+        self._jobs: dict[UUID, BulkJob] = {}
+        self._tasks: dict[UUID, asyncio.Task[None]] = {}
+
+    def get(self, job_id: UUID) -> BulkJob | None:
+        return self._jobs.get(job_id)
+
+    def start_delete(
+            self,
+            search_filters: list[filters.SearchFilter],
+            chunk_size: int,
+            throttle_ms: int = 0,
+    ) -> BulkJob:
+        """Start deleting every user matched by ``search_filters``."""
+        def build_statement(ids: list[UUID]) -> Delete:
+            return delete(User).where(User.id.in_(ids))
+
+        return self._start("delete", search_filters, build_statement, chunk_size, throttle_ms)
+
+    def start_update(
+            self,
+            search_filters: list[filters.SearchFilter],
+            values: dict[str, Any],
+            chunk_size: int,
+            throttle_ms: int = 0,
+    ) -> BulkJob:
+        """Start setting ``values`` on every user matched by ``search_filters``."""
+        def build_statement(ids: list[UUID]) -> Update:
+            return (
+                update(User)
+                .where(User.id.in_(ids))
+                .values(**values, updated_at=datetime.now(timezone.utc))
+            )
+
+        return self._start("update", search_filters, build_statement, chunk_size, throttle_ms)
+
+    async def shutdown(self) -> None:
+        """Cancel jobs that are still running."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _start(
+            self,
+            operation: str,
+            search_filters: list[filters.SearchFilter],
+            build_statement: Callable[[list[UUID]], Delete | Update],
+            chunk_size: int,
+            throttle_ms: int,
+    ) -> BulkJob:
+        self._prune()
+        job = BulkJob(operation=operation)
+        self._jobs[job.id] = job
+        task = asyncio.create_task(self._run(job, search_filters, build_statement, chunk_size, throttle_ms))
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.id, None))
+        return job
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished_at is not None]
+        for job_id in finished[:max(0, len(self._jobs) - self._max_jobs + 1)]:
+            del self._jobs[job_id]
+
+    async def _run(
+            self,
+            job: BulkJob,
+            search_filters: list[filters.SearchFilter],
+            build_statement: Callable[[list[UUID]], Delete | Update],
+            chunk_size: int,
+            throttle_ms: int,
+    ) -> None:
+        job.status = JobStatus.RUNNING
+        try:
+            async with self._db_config.get_session() as session:
+                job.total = await session.scalar(
+                    _apply_filters(select(func.count()).select_from(User), search_filters)
+                )
+                await session.commit()
+
+                last_id: UUID | None = None
+                while True:
+                    statement = _apply_filters(select(User.id), search_filters)
+                    if last_id is not None:
+                        statement = statement.where(User.id > last_id)
+                    ids = list(await session.scalars(statement.order_by(User.id).limit(chunk_size)))
+                    if not ids:
+                        break
+
+                    result = await session.execute(
+                        build_statement(ids).execution_options(synchronize_session=False)
+                    )
+                    await session.commit()
+                    job.processed += result.rowcount
+                    last_id = ids[-1]
+
+                    if len(ids) < chunk_size:
+                        break
+                    if throttle_ms:
+                        await asyncio.sleep(throttle_ms / 1000)
+        except asyncio.CancelledError:
+            job.status = JobStatus.CANCELLED
+            raise
+        except Exception:
+            logger.exception("Bulk %s job %s failed after %d users", job.operation, job.id, job.processed)
+            job.status = JobStatus.FAILED
+            job.error = f"Bulk {job.operation} failed after {job.processed} users"
+        else:
+            job.status = JobStatus.COMPLETED
+        finally:
+            job.finished_at = datetime.now(timezone.utc)
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+
+from advanced_alchemy.extensions.litestar import filters
+
+
+@dataclass
+class LiteralSearchFilter(filters.SearchFilter):
+    """``SearchFilter`` that treats ``%`` and ``_`` in the value as plain characters."""
+
+    def get_search_clauses(self, model):
+        value = self.value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return [
+            self._func(self._get_instrumented_attr(model, field_name))(f"%{value}%", escape="\\")
+            for field_name in self.normalized_field_names
+        ]
+
+
+def build_search_filters(
+        name: str | None,
+        surname: str | None,
+        literal: bool = False,
+) -> list[filters.SearchFilter]:
+    """Build the case-insensitive name/surname filters shared by listing and bulk jobs.
+
+    With ``literal`` set, LIKE wildcards in the values are escaped, so a value such as
+    ``%`` cannot match every user.
+    """
+    filter_type = LiteralSearchFilter if literal else filters.SearchFilter
+    search_filters = []
+    if name:
+        search_filters.append(filter_type(field_name="name", value=name, ignore_case=True))
+    if surname:
+        search_filters.append(filter_type(field_name="surname", value=surname, ignore_case=True))
+    return search_filters
@@ -1,6 +1,9 @@
+import asyncio
 import pytest
+from litestar.testing import AsyncTestClient
 from sqlalchemy import text
 import logging
+from datetime import datetime
 from uuid import UUID
 
 logger = logging.getLogger(__name__)
@@ -158,4 +161,169 @@ async def test_database_persistence(client):
             logger.error(f"No user found with id {user_id}")
             pytest.fail(f"No user found with id {user_id}")
         assert user.name == "John"
-        assert user.surname == "Doe"
\ No newline at end of file
+        assert user.surname == "Doe"
+
+async def wait_for_job(client, job_id):
+    for _ in range(50):
+        response = await client.get(f"/jobs/{job_id}")
+        assert response.status_code == 200
+        job = response.json()
+        if job["finished_at"] is not None:
+            return job
+        await asyncio.sleep(0.1)
+    pytest.fail(f"Job {job_id} did not finish")
+
+@pytest.mark.asyncio
+async def test_bulk_delete_users(client):
+    """Проверка массового удаления пользователей по фильтру."""
+    for surname in ("Doe", "Roe", "Poe"):
+        create_response = await client.post(
+            "/users",
+            json={"name": "John", "surname": surname, "password": "Secret1!"}
+        )
+        assert create_response.status_code == 201
+    create_response = await client.post(
+        "/users",
+        json={"name": "Jane", "surname": "Doe", "password": "Secret1!"}
+    )
+    assert create_response.status_code == 201
+    response = await client.post("/users/bulk-delete", json={"name": "john", "chunk_size": 2})
+    logger.info(f"Bulk delete response status: {response.status_code}, body: {response.text}")
+    assert response.status_code == 202
+    job = await wait_for_job(client, response.json()["id"])
+    assert job["status"] == "completed"
+    assert job["total"] == 3
+    assert job["processed"] == 3
+    get_response = await client.get("/users")
+    data = get_response.json()
+    assert len(data) == 1
+    assert data[0]["name"] == "Jane"
+
+@pytest.mark.asyncio
+async def test_bulk_update_users(client):
+    """Проверка массового обновления пользователей по фильтру."""
+    for name in ("John", "Jack", "Jane"):
+        create_response = await client.post(
+            "/users",
+            json={"name": name, "surname": "Doe", "password": "Secret1!"}
+        )
+        assert create_response.status_code == 201
+    response = await client.post(
+        "/users/bulk-update",
+        json={"surname": "doe", "chunk_size": 2, "throttle_ms": 10, "data": {"surname": "Smith"}}
+    )
+    logger.info(f"Bulk update response status: {response.status_code}, body: {response.text}")
+    assert response.status_code == 202
+    job = await wait_for_job(client, response.json()["id"])
+    assert job["status"] == "completed"
+    assert job["processed"] == 3
+    get_response = await client.get("/users")
+    assert {user["surname"] for user in get_response.json()} == {"Smith"}
+
+@pytest.mark.asyncio
+async def test_bulk_operations_require_filter(client):
+    """Проверка ошибки при запуске массовой операции без фильтра."""
+    response = await client.post("/users/bulk-delete", json={})
+    assert response.status_code == 400
+    response = await client.post("/users/bulk-update", json={"name": "John", "data": {}})
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_bulk_update_rejects_null_fields(client):
+    """Проверка ошибки при попытке массово установить поле в null."""
+    create_response = await client.post(
+        "/users",
+        json={"name": "John", "surname": "Doe", "password": "Secret1!"}
+    )
+    assert create_response.status_code == 201
+    response = await client.post("/users/bulk-update", json={"name": "john", "data": {"name": None}})
+    logger.info(f"Bulk update response status: {response.status_code}, body: {response.text}")
+    assert response.status_code == 400
+    assert "null" in response.json()["detail"].lower()
+    get_response = await client.get("/users")
+    assert get_response.json()[0]["name"] == "John"
+
+@pytest.mark.asyncio
+async def test_get_job_not_found(client):
+    """Проверка ошибки при попытке получить несуществующую задачу."""
+    response = await client.get("/jobs/123e4567-e89b-12d3-a456-426614174000")
+    assert response.status_code == 404
+    assert "not found" in response.json()["detail"].lower()
+
+@pytest.mark.asyncio
+async def test_bulk_delete_wildcards_are_literal(client):
+    """Проверка, что символы % и _ в фильтре массового удаления не совпадают со всеми пользователями."""
+    for name in ("John", "Jane", "Jo%n"):
+        create_response = await client.post(
+            "/users",
+            json={"name": name, "surname": "Doe", "password": "Secret1!"}
+        )
+        assert create_response.status_code == 201
+    response = await client.post("/users/bulk-delete", json={"name": "_"})
+    assert response.status_code == 202
+    job = await wait_for_job(client, response.json()["id"])
+    assert job["status"] == "completed"
+    assert job["processed"] == 0
+    response = await client.post("/users/bulk-delete", json={"name": "%"})
+    assert response.status_code == 202
+    job = await wait_for_job(client, response.json()["id"])
+    assert job["status"] == "completed"
+    assert job["processed"] == 1
+    get_response = await client.get("/users")
+    assert {user["name"] for user in get_response.json()} == {"John", "Jane"}
+
+@pytest.mark.asyncio
+async def test_bulk_job_failure_hides_database_error(client, caplog):
+    """Проверка статуса failed и скрытия ошибки базы данных при сбое массовой операции."""
+    engine = client.app.state.get("db_engine")
+    async with engine.begin() as conn:
+        await conn.execute(text('DROP TABLE "user"'))
+    with caplog.at_level(logging.ERROR):
+        response = await client.post("/users/bulk-delete", json={"name": "John"})
+        assert response.status_code == 202
+        job = await wait_for_job(client, response.json()["id"])
+    assert job["status"] == "failed"
+    assert job["processed"] == 0
+    assert job["error"] == "Bulk delete failed after 0 users"
+    assert any(record.exc_info for record in caplog.records)
+
+@pytest.mark.asyncio
+async def test_bulk_job_throttle(client):
+    """Проверка паузы между частями массовой операции."""
+    for surname in ("Doe", "Roe", "Poe"):
+        create_response = await client.post(
+            "/users",
+            json={"name": "John", "surname": surname, "password": "Secret1!"}
+        )
+        assert create_response.status_code == 201
+    response = await client.post("/users/bulk-delete", json={"name": "John", "chunk_size": 1, "throttle_ms": 200})
+    assert response.status_code == 202
+    job = await wait_for_job(client, response.json()["id"])
+    assert job["status"] == "completed"
+    assert job["processed"] == 3
+    duration = datetime.fromisoformat(job["finished_at"]) - datetime.fromisoformat(job["created_at"])
+    assert duration.total_seconds() >= 0.4
+
+@pytest.mark.asyncio
+async def test_bulk_job_cancelled_on_shutdown(app_client):
+    """Проверка отмены выполняющейся массовой операции при остановке приложения."""
+    async with AsyncTestClient(app=app_client) as client:
+        for surname in ("Doe", "Roe"):
+            create_response = await client.post(
+                "/users",
+                json={"name": "John", "surname": surname, "password": "Secret1!"}
+            )
+            assert create_response.status_code == 201
+        response = await client.post("/users/bulk-delete", json={"name": "John", "chunk_size": 1, "throttle_ms": 60000})
+        assert response.status_code == 202
+        job_id = response.json()["id"]
+        for _ in range(50):
+            job = (await client.get(f"/jobs/{job_id}")).json()
+            if job["processed"] == 1:
+                break
+            await asyncio.sleep(0.1)
+        assert job["status"] == "running"
+    job = app_client.state.bulk_jobs.get(UUID(job_id))
+    assert job.status == "cancelled"
+    assert job.processed == 1
+    assert job.finished_at is not None